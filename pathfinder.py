@@ -3,7 +3,8 @@
 # GOOD PERFORMANCE TIME APP
 # ============================================================
 # HOW TO RUN:
-#   pip install pygame
+#   pip install pygame-ce numpy
+#   (pygame-ce is the maintained, faster fork; plain pygame still works)
 #   Make sure pathfinder_part1.py is in the SAME folder as this file
 #   Then run:  python pathfinder_part2.py
 #
@@ -26,7 +27,15 @@
 
 import pygame
 import sys
-import time
+
+import numpy as np
+
+# numba is optional: with it installed the per-cell tag build runs as a
+# compiled kernel; without it the set-based build below is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # import everything from Part 1
 from pathfinder_part1 import (
@@ -48,6 +57,15 @@ GRID_PX_H    = ROWS * CELL_SIZE
 WIN_W        = GRID_PX_W + PANEL_WIDTH + MARGIN_LEFT * 2
 WIN_H        = GRID_PX_H + MARGIN_TOP + MARGIN_BOT
 
+# grid bounding box in screen pixels (for fast pointer hit-testing)
+GRID_X0      = MARGIN_LEFT
+GRID_Y0      = MARGIN_TOP
+GRID_X1      = GRID_X0 + GRID_PX_W
+GRID_Y1      = GRID_Y0 + GRID_PX_H
+
+# posted by pygame's timer to pace auto-play stepping
+STEP_EVENT   = pygame.USEREVENT + 1
+
 # ──────────────────────────────────────────────
 # COLOUR PALETTE
 # ──────────────────────────────────────────────
@@ -72,6 +90,49 @@ C_WHITE      = (255, 255, 255)
 C_FOUND      = ( 80, 220, 120)  # success green
 C_FAIL       = (220,  80,  80)  # failure red
 
+# ──────────────────────────────────────────────
+# CELL STATE TAGS  (used by the vectorized redraw)
+# ──────────────────────────────────────────────
+# Each cell's visual state collapses to one small int; the tags index
+# straight into PALETTE, so the whole grid colours in one NumPy gather.
+T_EMPTY, T_WALL, T_DYN, T_START, T_TARGET, T_PATH, T_FRONTIER, T_EXPLORED = range(8)
+
+PALETTE = np.array([
+    C_CELL_EMPTY,   # T_EMPTY
+    C_WALL,         # T_WALL
+    C_DYN_WALL,     # T_DYN
+    C_START,        # T_START
+    C_TARGET,       # T_TARGET
+    C_PATH,         # T_PATH
+    C_FRONTIER,     # T_FRONTIER
+    C_EXPLORED,     # T_EXPLORED
+], dtype=np.uint8)
+
+if njit is not None:
+    @njit(cache=True)
+    def _state_kernel(out, wall, dyn, path, frontier, explored,
+                      sr, sc, tr, tc):
+        """Dense per-cell tag build, compiled by numba.
+
+        Branch-heavy integer loops like this beat NumPy vectorization
+        once jitted; cache=True avoids recompiling on every launch.
+        """
+        rows, cols = out.shape
+        for r in range(rows):
+            for c in range(cols):
+                if wall[r, c]:
+                    out[r, c] = T_DYN if dyn[r, c] else T_WALL
+                elif path[r, c]:
+                    out[r, c] = T_PATH
+                elif frontier[r, c]:
+                    out[r, c] = T_FRONTIER
+                elif explored[r, c]:
+                    out[r, c] = T_EXPLORED
+                else:
+                    out[r, c] = T_EMPTY
+        out[sr, sc] = T_START
+        out[tr, tc] = T_TARGET
+
 # ──────────────────────────────────────────────
 # BUTTON CLASS
 # ──────────────────────────────────────────────
@@ -84,29 +145,28 @@ class Button:
         self.color  = color
         self.active = False          # True when this algo is selected
 
-    def draw(self, surface, font, mouse_pos):
-        # pick colour based on state
+    def draw(self, surface, font, hovered, rect=None):
+        # pick colour based on state (hover is resolved by the caller
+        # with one collidelist over every button); rect overrides the
+        # screen position when drawing into a cached panel surface
+        if rect is None:
+            rect = self.rect
         if self.active:
             col = C_BTN_ACT
-        elif self.rect.collidepoint(mouse_pos):
+        elif hovered:
             col = C_BTN_HOV
         else:
             col = self.color
 
-        pygame.draw.rect(surface, col, self.rect, border_radius=6)
-        pygame.draw.rect(surface, C_GRID_LINE, self.rect,
+        pygame.draw.rect(surface, col, rect, border_radius=6)
+        pygame.draw.rect(surface, C_GRID_LINE, rect,
                          width=1, border_radius=6)
 
         text_surf = font.render(self.label, True, C_BTN_TEXT)
-        tx = self.rect.centerx - text_surf.get_width()  // 2
-        ty = self.rect.centery - text_surf.get_height() // 2
+        tx = rect.centerx - text_surf.get_width()  // 2
+        ty = rect.centery - text_surf.get_height() // 2
         surface.blit(text_surf, (tx, ty))
 
-    def is_clicked(self, event):
-        return (event.type == pygame.MOUSEBUTTONDOWN
-                and event.button == 1
-                and self.rect.collidepoint(event.pos))
-
 
 # ──────────────────────────────────────────────
 # MAIN APPLICATION CLASS
@@ -129,11 +189,13 @@ class PathfinderApp:
 
         self.grid = Grid(ROWS, COLS)
 
-        # search state
+        # search state – these containers are created once and only
+        # ever mutated in place, so references to them never go stale
         self.generator    = None   # current algorithm generator
         self.frontier     = set()
         self.explored     = set()
         self.path         = []
+        self._path_set    = set()  # set view of path, for O(1) membership
         self.found        = False
         self.failed       = False
         self.running      = False  # is the algorithm actively stepping?
@@ -144,19 +206,105 @@ class PathfinderApp:
         self.dynamic_walls = set()
 
         # speed: steps per second
-        self.speed   = 8
-        self.last_t  = 0
+        self.speed = 8
 
         # step mode: if True, user must press "Next Step" manually
         self.step_mode = False
 
+        # dirty-frame flag: run() repaints only when something changed
+        self.needs_redraw = True
+
         # re-plan counter
         self.replan_count = 0
 
+        # precomputed cell rects – building a fresh pygame.Rect per
+        # cell per frame is pure allocation churn
+        self.rects = [
+            [pygame.Rect(MARGIN_LEFT + c * CELL_SIZE,
+                         MARGIN_TOP + r * CELL_SIZE,
+                         CELL_SIZE, CELL_SIZE)
+             for c in range(COLS)]
+            for r in range(ROWS)
+        ]
+        # per-cell state tags: current frame and what was drawn last
+        # frame (255 forces a full first paint); colouring the grid is
+        # then a single PALETTE[self.state] gather instead of a Python
+        # branch ladder per cell
+        self.state      = np.zeros((ROWS, COLS), np.uint8)
+        self.prev_state = np.full((ROWS, COLS), 255, np.uint8)
+
+        # boolean masks fed to the numba kernel (wall/dyn/path/
+        # frontier/explored), maintained alongside the Python sets
+        if njit is not None:
+            self._masks = np.zeros((5, ROWS, COLS), np.bool_)
+
+        self._grid_rect = pygame.Rect(MARGIN_LEFT, MARGIN_TOP,
+                                      GRID_PX_W, GRID_PX_H)
+
+        # surfaces reused on every repaint: the cell image is written
+        # in place through surfarray and scaled into a fixed buffer,
+        # so no surface is allocated per frame
+        self._grid_surf   = pygame.Surface((COLS, ROWS)).convert()
+        self._scaled_surf = pygame.Surface((GRID_PX_W, GRID_PX_H)).convert()
+
+        # grid lines drawn once into a transparent overlay –
+        # COLS+ROWS lines at init instead of ROWS*COLS outline
+        # rects per repaint
+        self._lines = pygame.Surface((GRID_PX_W, GRID_PX_H),
+                                     pygame.SRCALPHA)
+        for c in range(COLS + 1):
+            x = min(c * CELL_SIZE, GRID_PX_W - 1)
+            pygame.draw.line(self._lines, C_GRID_LINE,
+                             (x, 0), (x, GRID_PX_H - 1))
+        for r in range(ROWS + 1):
+            y = min(r * CELL_SIZE, GRID_PX_H - 1)
+            pygame.draw.line(self._lines, C_GRID_LINE,
+                             (0, y), (GRID_PX_W - 1, y))
+        # match the display pixel format so blits skip per-pixel conversion
+        self._lines = self._lines.convert_alpha()
+
+        # cell labels rendered once – font rasterization is far too
+        # expensive to repeat per cell per frame; store each surface
+        # with its centering offsets
+        self._labels = {}
+        for ch in ("S", "T", "■"):
+            surf = self.font_btn.render(ch, True, C_BG).convert_alpha()
+            self._labels[ch] = (surf,
+                                surf.get_width()  // 2,
+                                surf.get_height() // 2)
+
         # build UI buttons
         self._build_buttons()
 
-        self.clock = pygame.time.Clock()
+        # the three chrome regions outside the grid (title bar, panel,
+        # status bar); draw() repaints each only when its content changes
+        self._chrome_rects = [
+            pygame.Rect(0, 0, WIN_W, MARGIN_TOP),                      # title bar
+            pygame.Rect(GRID_PX_W + MARGIN_LEFT * 2, MARGIN_TOP,
+                        PANEL_WIDTH, GRID_PX_H),                       # panel
+            pygame.Rect(0, WIN_H - MARGIN_BOT, WIN_W, MARGIN_BOT),     # status bar
+        ]
+
+        # static text is rasterized once; the title-bar info line is
+        # cached per (algo, speed, replans) so font.render only runs
+        # when one of those actually changes
+        self._title_surf  = self.font_title.render(
+            "  GOOD PERFORMANCE TIME APP  –  AI Grid Pathfinder",
+            True, C_TITLE).convert_alpha()
+        self._info_cache  = {}
+        self._legend_surf = self._build_legend()
+        self._panel_bg    = self._build_panel_bg()
+
+        # what each chrome region showed last frame – draw() skips and
+        # doesn't present regions whose key hasn't changed
+        self._last_title_key  = None
+        self._last_panel_sig  = None
+        self._last_status_key = None
+
+        # paint the static background once; after this, draw() only
+        # touches the regions that change
+        self.screen.fill(C_BG)
+        pygame.display.flip()
 
     # ── build all buttons ────────────────────────────────
     def _build_buttons(self):
@@ -189,115 +337,195 @@ class PathfinderApp:
 
         self.info_y = py + 10   # where to draw the legend / info text
 
+        # flat button list plus a parallel rect list, so hover and
+        # click hit-testing run as one C-level collidelist instead of
+        # a Python collidepoint per button
+        self._all_buttons = list(self.algo_buttons.values()) + [
+            self.btn_reset, self.btn_speed_up, self.btn_speed_dn,
+            self.btn_step, self.btn_next,
+        ]
+        self._btn_rects  = [b.rect for b in self._all_buttons]
+        self._mouse_rect = pygame.Rect(0, 0, 1, 1)   # reusable probe
+
     # ──────────────────────────────────────────────────────
     # GRID → pixel helpers
     # ──────────────────────────────────────────────────────
     def cell_rect(self, row, col):
-        """Return the pygame.Rect for a given grid cell."""
-        x = MARGIN_LEFT + col * CELL_SIZE
-        y = MARGIN_TOP  + row * CELL_SIZE
-        return pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
+        """Return the (cached) pygame.Rect for a given grid cell."""
+        return self.rects[row][col]
 
     def pixel_to_cell(self, px, py):
         """Convert a screen pixel position to (row, col), or None."""
-        col = (px - MARGIN_LEFT) // CELL_SIZE
-        row = (py - MARGIN_TOP)  // CELL_SIZE
-        if 0 <= row < ROWS and 0 <= col < COLS:
-            return (row, col)
-        return None
+        # cheap bounding-box rejection first – most pointer positions
+        # during a drag are outside the grid or settle the question
+        # before any division happens
+        if not (GRID_X0 <= px < GRID_X1 and GRID_Y0 <= py < GRID_Y1):
+            return None
+        return ((py - GRID_Y0) // CELL_SIZE,
+                (px - GRID_X0) // CELL_SIZE)
 
     # ──────────────────────────────────────────────────────
     # DRAWING
     # ──────────────────────────────────────────────────────
     def draw(self):
-        self.screen.fill(C_BG)
-        self._draw_title_bar()
-        self._draw_grid()
-        self._draw_panel()
-        self._draw_status_bar()
-        pygame.display.flip()
+        # each section repaints only if its content changed and returns
+        # the regions it touched; present exactly those
+        dirty  = self._draw_title_bar()
+        dirty += self._draw_grid()
+        dirty += self._draw_panel()
+        dirty += self._draw_status_bar()
+        if dirty:
+            pygame.display.update(dirty)
 
     def _draw_title_bar(self):
-        title = "  GOOD PERFORMANCE TIME APP  –  AI Grid Pathfinder"
-        surf  = self.font_title.render(title, True, C_TITLE)
-        self.screen.blit(surf, (10, 14))
-
-        # show algorithm name and speed
-        info = f"Algorithm: {self.algo_name or '—'}   |   Speed: {self.speed} steps/s   |   Re-plans: {self.replan_count}"
-        isurf = self.font_status.render(info, True, C_STATUS)
+        key = (self.algo_name, self.speed, self.replan_count)
+        if key == self._last_title_key:
+            return []
+        self._last_title_key = key
+
+        self.screen.fill(C_BG, self._chrome_rects[0])
+        self.screen.blit(self._title_surf, (10, 14))
+
+        # show algorithm name and speed (re-rendered only on change)
+        isurf = self._info_cache.get(key)
+        if isurf is None:
+            info = f"Algorithm: {key[0] or '—'}   |   Speed: {key[1]} steps/s   |   Re-plans: {key[2]}"
+            isurf = self.font_status.render(info, True, C_STATUS).convert_alpha()
+            self._info_cache[key] = isurf
         self.screen.blit(isurf, (10, 38))
+        return [self._chrome_rects[0]]
 
-    def _draw_grid(self):
-        for row in range(ROWS):
-            for col in range(COLS):
-                rect = self.cell_rect(row, col)
-                pos  = (row, col)
-                val  = self.grid.grid[row][col]
-
-                # ── choose fill colour ──
-                if val == WALL:
-                    if pos in self.dynamic_walls:
-                        color = C_DYN_WALL
-                    else:
-                        color = C_WALL
-                elif pos == self.grid.start:
-                    color = C_START
-                elif pos == self.grid.target:
-                    color = C_TARGET
-                elif pos in self.path:
-                    color = C_PATH
-                elif pos in self.frontier:
-                    color = C_FRONTIER
-                elif pos in self.explored:
-                    color = C_EXPLORED
-                else:
-                    color = C_CELL_EMPTY
-
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, C_GRID_LINE, rect, 1)
+    def _build_state(self):
+        """Refresh the (ROWS, COLS) uint8 tag array from the search sets.
 
-                # ── cell labels ──
-                if pos == self.grid.start:
-                    self._draw_cell_label(rect, "S", C_BG)
-                elif pos == self.grid.target:
-                    self._draw_cell_label(rect, "T", C_BG)
-                elif val == WALL:
-                    self._draw_cell_label(rect, "■", C_BG)
+        Writes are O(occupied cells), not O(ROWS*COLS): each set is
+        walked once, in precedence order (path over frontier, walls
+        over path, S/T on top).
+        """
+        if njit is not None:
+            self._build_state_jit()
+            return
+        # hoist the attribute chains out of the loops – LOAD_FAST is
+        # several times cheaper than repeated LOAD_ATTR pairs
+        state = self.state
+        grid  = self.grid
+        dyn   = self.dynamic_walls
+        state.fill(T_EMPTY)
+        for r, c in self.explored:
+            state[r, c] = T_EXPLORED
+        for r, c in self.frontier:
+            state[r, c] = T_FRONTIER
+        for r, c in self._path_set:
+            state[r, c] = T_PATH
+        for r, c in grid.walls:
+            state[r, c] = T_DYN if (r, c) in dyn else T_WALL
+        sr, sc = grid.start
+        tr, tc = grid.target
+        state[sr, sc] = T_START
+        state[tr, tc] = T_TARGET
+
+    def _build_state_jit(self):
+        """Fill the boolean masks from the sets and run the kernel."""
+        grid  = self.grid
+        masks = self._masks
+        masks[:] = False
+        wall, dyn, path, frontier, explored = masks
+        for r, c in grid.walls:
+            wall[r, c] = True
+        for r, c in self.dynamic_walls:
+            dyn[r, c] = True
+        for r, c in self._path_set:
+            path[r, c] = True
+        for r, c in self.frontier:
+            frontier[r, c] = True
+        for r, c in self.explored:
+            explored[r, c] = True
+        sr, sc = grid.start
+        tr, tc = grid.target
+        _state_kernel(self.state, wall, dyn, path, frontier, explored,
+                      sr, sc, tr, tc)
 
-    def _draw_cell_label(self, rect, text, color):
-        surf = self.font_btn.render(text, True, color)
-        self.screen.blit(surf,
-                         (rect.centerx - surf.get_width()  // 2,
-                          rect.centery - surf.get_height() // 2))
+    def _draw_grid(self):
+        """Repaint the grid if anything changed since last frame.
+
+        Returns the list of dirty rects for pygame.display.update().
+        """
+        self._build_state()
+        if np.array_equal(self.state, self.prev_state):
+            return []           # nothing changed – skip the repaint
+        self.prev_state[:] = self.state
+
+        # one C-level gather colours every cell at once, written
+        # straight into the reused surface's pixel buffer
+        arr = pygame.surfarray.pixels3d(self._grid_surf)
+        arr[:] = PALETTE[self.state].swapaxes(0, 1)
+        del arr     # release the surface lock before blitting
+        pygame.transform.scale(self._grid_surf,
+                               (GRID_PX_W, GRID_PX_H), self._scaled_surf)
+        self.screen.blit(self._scaled_surf, self._grid_rect)
+
+        # cell outlines – single blit of the cached overlay
+        self.screen.blit(self._lines, self._grid_rect)
+
+        # ── cell labels ──
+        sr, sc = self.grid.start
+        tr, tc = self.grid.target
+        self._draw_cell_label(self.rects[sr][sc], "S")
+        self._draw_cell_label(self.rects[tr][tc], "T")
+        for r, c in self.grid.walls:
+            self._draw_cell_label(self.rects[r][c], "■")
+
+        return [self._grid_rect]
+
+    def _draw_cell_label(self, rect, text):
+        surf, half_w, half_h = self._labels[text]
+        self.screen.blit(surf, (rect.centerx - half_w,
+                                rect.centery - half_h))
+
+    def _build_panel_bg(self):
+        """Render the panel's static look – background, border, every
+        button in its inactive state, and the legend – into one cached
+        surface. Rebuilt only when a button label changes."""
+        panel_rect = self._chrome_rects[1]
+        bg = pygame.Surface(panel_rect.size)
+        bg.fill(C_PANEL)
+        pygame.draw.rect(bg, C_GRID_LINE, bg.get_rect(), 1)
+
+        ox, oy = panel_rect.topleft
+        for btn in self._all_buttons:
+            was_active = btn.active
+            btn.active = False          # bake the inactive look
+            btn.draw(bg, self.font_btn, False, btn.rect.move(-ox, -oy))
+            btn.active = was_active
+
+        bg.blit(self._legend_surf, (12, self.info_y - MARGIN_TOP))
+        return bg.convert()
 
     def _draw_panel(self):
-        # panel background
-        panel_rect = pygame.Rect(
-            GRID_PX_W + MARGIN_LEFT * 2, MARGIN_TOP,
-            PANEL_WIDTH, GRID_PX_H
-        )
-        pygame.draw.rect(self.screen, C_PANEL, panel_rect)
-        pygame.draw.rect(self.screen, C_GRID_LINE, panel_rect, 1)
-
-        mouse = pygame.mouse.get_pos()
-
-        # algo buttons
-        for name, btn in self.algo_buttons.items():
-            btn.draw(self.screen, self.font_btn, mouse)
-
-        # utility buttons
-        self.btn_reset.draw(self.screen, self.font_btn, mouse)
-        self.btn_speed_up.draw(self.screen, self.font_btn, mouse)
-        self.btn_speed_dn.draw(self.screen, self.font_btn, mouse)
-        self.btn_step.draw(self.screen, self.font_btn, mouse)
-        self.btn_next.draw(self.screen, self.font_btn, mouse)
-
-        # colour legend
-        self._draw_legend()
-
-    def _draw_legend(self):
-        x  = GRID_PX_W + MARGIN_LEFT * 2 + 12
-        y  = self.info_y
+        # repaint only when hover, activation, or a label changed
+        self._mouse_rect.topleft = pygame.mouse.get_pos()
+        hover_idx = self._mouse_rect.collidelist(self._btn_rects)
+        sig = (hover_idx,
+               tuple(btn.active for btn in self._all_buttons),
+               self.btn_step.label)
+        if sig == self._last_panel_sig:
+            return []
+        self._last_panel_sig = sig
+
+        # static panel content in one blit…
+        self.screen.blit(self._panel_bg, self._chrome_rects[1])
+
+        # …then overdraw only the buttons that differ from the baked
+        # inactive look (hovered or active)
+        for i, btn in enumerate(self._all_buttons):
+            hovered = i == hover_idx
+            if hovered or btn.active:
+                btn.draw(self.screen, self.font_btn, hovered)
+
+        return [self._chrome_rects[1]]
+
+    def _build_legend(self):
+        """Render the colour legend and hint text once into a surface."""
         fs = self.font_cell
 
         items = [
@@ -309,47 +537,59 @@ class PathfinderApp:
             (C_EXPLORED, "Explored"),
             (C_PATH,     "Final Path"),
         ]
-        for color, label in items:
-            pygame.draw.rect(self.screen, color,
-                             pygame.Rect(x, y, 14, 14), border_radius=2)
-            surf = fs.render(label, True, C_STATUS)
-            self.screen.blit(surf, (x + 20, y))
-            y += 20
-
-        # hint
-        y += 8
         hints = [
             "Left-click: toggle wall",
             "Right-drag: paint walls",
             "Click an algo to start",
         ]
+
+        height = len(items) * 20 + 8 + len(hints) * 18
+        legend = pygame.Surface((PANEL_WIDTH - 24, height),
+                                pygame.SRCALPHA)
+
+        y = 0
+        for color, label in items:
+            pygame.draw.rect(legend, color,
+                             pygame.Rect(0, y, 14, 14), border_radius=2)
+            legend.blit(fs.render(label, True, C_STATUS), (20, y))
+            y += 20
+
+        y += 8
         for h in hints:
-            s = fs.render(h, True, (100, 110, 140))
-            self.screen.blit(s, (x, y))
+            legend.blit(fs.render(h, True, (100, 110, 140)), (0, y))
             y += 18
 
+        return legend.convert_alpha()
+
     def _draw_status_bar(self):
-        # bottom status bar
-        rect  = pygame.Rect(0, WIN_H - MARGIN_BOT, WIN_W, MARGIN_BOT)
+        color = C_FOUND if self.found else (C_FAIL if self.failed else C_STATUS)
+        key   = (self.message, color)
+        if key == self._last_status_key:
+            return []
+        self._last_status_key = key
+
+        # bottom status bar (rect cached with the other chrome regions)
+        rect = self._chrome_rects[2]
         pygame.draw.rect(self.screen, C_PANEL, rect)
         pygame.draw.rect(self.screen, C_GRID_LINE, rect, 1)
 
-        color = C_FOUND if self.found else (C_FAIL if self.failed else C_STATUS)
-        surf  = self.font_status.render(self.message, True, color)
+        surf = self.font_status.render(self.message, True, color)
         self.screen.blit(surf, (12, WIN_H - MARGIN_BOT + 10))
+        return [rect]
 
     # ──────────────────────────────────────────────────────
     # START AN ALGORITHM
     # ──────────────────────────────────────────────────────
     def start_algorithm(self, name):
         """Reset search state and start the chosen algorithm generator."""
-        # clear previous results
-        self.frontier      = set()
-        self.explored      = set()
-        self.path          = []
+        # clear previous results (in place – no fresh allocations)
+        self.frontier.clear()
+        self.explored.clear()
+        self.path.clear()
+        self._path_set.clear()
+        self.dynamic_walls.clear()
         self.found         = False
         self.failed        = False
-        self.dynamic_walls = set()
         self.replan_count  = 0
         self.algo_name     = name
         self.message       = f"Running {name}…"
@@ -363,7 +603,15 @@ class PathfinderApp:
         algo_fn       = ALGORITHMS[name]
         self.generator = algo_fn(self.grid)
         self.running   = True
-        self.last_t    = time.time()
+        self._arm_step_timer()
+
+    # ── auto-play pacing ─────────────────────────────────
+    def _arm_step_timer(self):
+        """(Re)arm the OS timer that posts STEP_EVENT at the current speed."""
+        pygame.time.set_timer(STEP_EVENT, max(1, 1000 // self.speed))
+
+    def _cancel_step_timer(self):
+        pygame.time.set_timer(STEP_EVENT, 0)
 
     # ──────────────────────────────────────────────────────
     # ADVANCE ONE STEP
@@ -377,41 +625,44 @@ class PathfinderApp:
             state = next(self.generator)
         except StopIteration:
             self.running = False
+            self._cancel_step_timer()
             return
 
-        self.frontier = state["frontier"]
-        self.explored = state["explored"]
-        self.path     = state["path"]
-        self.found    = state["found"]
-        self.failed   = state["failed"]
-        self.message  = state["message"]
-
-        # ── record any new dynamic walls ──
-        for r in range(ROWS):
-            for c in range(COLS):
-                pos = (r, c)
-                if (self.grid.grid[r][c] == WALL
-                        and pos not in self.dynamic_walls
-                        and pos != self.grid.start
-                        and pos != self.grid.target):
-                    # we'll mark ALL new walls since last reset as dynamic
-                    # (the grid class adds them; we track them here for colour)
-                    pass  # handled below
+        # refresh the long-lived containers in place rather than
+        # rebinding to the generator's objects
+        self.frontier.clear()
+        self.frontier.update(state["frontier"])
+        self.explored.clear()
+        self.explored.update(state["explored"])
+        self.path[:] = state["path"]
+        self._path_set.clear()
+        self._path_set.update(self.path)
+        self.found     = state["found"]
+        self.failed    = state["failed"]
+        self.message   = state["message"]
+        self.needs_redraw = True
+
+        grid = self.grid
+
+        # ── pick up walls spawned since the last step ──
+        # O(new walls) instead of rescanning the whole grid
+        if grid.dynamic_additions:
+            self.dynamic_walls |= grid.dynamic_additions
+            grid.dynamic_additions.clear()
 
         # detect if the planned path was blocked by a dynamic obstacle
-        if self.path and not self.found:
-            for pos in self.path:
-                if self.grid.grid[pos[0]][pos[1]] == WALL:
-                    # re-plan: restart the same algorithm
-                    self.replan_count += 1
-                    self.message = (f"⚠ Path blocked! Re-planning… "
-                                    f"(#{self.replan_count})")
-                    algo_fn        = ALGORITHMS[self.algo_name]
-                    self.generator = algo_fn(self.grid)
-                    break
+        # (single C-level set intersection instead of scanning the path)
+        if self.path and not self.found and self._path_set & grid.walls:
+            # re-plan: restart the same algorithm
+            self.replan_count += 1
+            self.message = (f"⚠ Path blocked! Re-planning… "
+                            f"(#{self.replan_count})")
+            algo_fn        = ALGORITHMS[self.algo_name]
+            self.generator = algo_fn(self.grid)
 
         if self.found or self.failed:
             self.running = False
+            self._cancel_step_timer()
             for btn in self.algo_buttons.values():
                 btn.active = False
 
@@ -420,16 +671,18 @@ class PathfinderApp:
     # ──────────────────────────────────────────────────────
     def reset(self):
         self.grid.reset()
+        self._cancel_step_timer()
         self.generator     = None
-        self.frontier      = set()
-        self.explored      = set()
-        self.path          = []
+        self.frontier.clear()
+        self.explored.clear()
+        self.path.clear()
+        self._path_set.clear()
+        self.dynamic_walls.clear()
         self.found         = False
         self.failed        = False
         self.running       = False
         self.message       = "Grid reset. Choose an algorithm."
         self.algo_name     = ""
-        self.dynamic_walls = set()
         self.replan_count  = 0
         for btn in self.algo_buttons.values():
             btn.active = False
@@ -439,17 +692,28 @@ class PathfinderApp:
     # ──────────────────────────────────────────────────────
     def run(self):
         dragging_wall = False   # for right-click drag painting
+        last_paint    = None    # last cell painted during a drag
 
         while True:
-            self.clock.tick(60)   # cap at 60 FPS
+            # ── wait for something to happen ────────────────
+            # The step timer posts STEP_EVENT at the auto-play cadence,
+            # so the loop can simply block until any event arrives –
+            # no polling, no per-iteration time.time() syscalls.
+            first  = pygame.event.wait()
+            events = [first] + pygame.event.get()
 
             # ── events ──────────────────────────────────────
-            for event in pygame.event.get():
+            for event in events:
 
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
 
+                # ── timed auto-play step ──
+                if (event.type == STEP_EVENT
+                        and self.running and not self.step_mode):
+                    self.step()
+
                 # ── keyboard shortcuts ──
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
@@ -473,54 +737,74 @@ class PathfinderApp:
                         dragging_wall = True
 
                     # ── button clicks ──
-                    for name, btn in self.algo_buttons.items():
-                        if btn.is_clicked(event):
-                            self.reset()              # clear previous run
-                            self.start_algorithm(name)
-
-                    if self.btn_reset.is_clicked(event):
-                        self.reset()
-
-                    if self.btn_speed_up.is_clicked(event):
-                        self.speed = min(self.speed + 2, 60)
-
-                    if self.btn_speed_dn.is_clicked(event):
-                        self.speed = max(self.speed - 2, 1)
-
-                    if self.btn_step.is_clicked(event):
-                        self.step_mode = not self.step_mode
-                        self.btn_step.label = (
-                            "Step Mode: ON"
-                            if self.step_mode
-                            else "Step Mode: OFF"
-                        )
+                    # find the clicked button with one C-level scan
+                    # over all rects instead of a collidepoint each
+                    idx = -1
+                    if event.button == 1:
+                        self._mouse_rect.topleft = event.pos
+                        idx = self._mouse_rect.collidelist(self._btn_rects)
+                    if idx != -1:
+                        btn = self._all_buttons[idx]
 
-                    if self.btn_next.is_clicked(event):
-                        if self.step_mode:
-                            self.step()
+                        if btn.label in self.algo_buttons:
+                            self.reset()              # clear previous run
+                            self.start_algorithm(btn.label)
+
+                        elif btn is self.btn_reset:
+                            self.reset()
+
+                        elif btn is self.btn_speed_up:
+                            self.speed = min(self.speed + 2, 60)
+                            if self.running:
+                                self._arm_step_timer()
+
+                        elif btn is self.btn_speed_dn:
+                            self.speed = max(self.speed - 2, 1)
+                            if self.running:
+                                self._arm_step_timer()
+
+                        elif btn is self.btn_step:
+                            self.step_mode = not self.step_mode
+                            self.btn_step.label = (
+                                "Step Mode: ON"
+                                if self.step_mode
+                                else "Step Mode: OFF"
+                            )
+                            # label changed – re-bake the panel background
+                            self._panel_bg = self._build_panel_bg()
+
+                        elif btn is self.btn_next:
+                            if self.step_mode:
+                                self.step()
 
                 if event.type == pygame.MOUSEBUTTONUP:
                     if event.button == 3:
                         dragging_wall = False
+                        last_paint    = None
 
-                if event.type == pygame.MOUSEMOTION and dragging_wall:
-                    cell = self.pixel_to_cell(*event.pos)
-                    if cell:
-                        r, c = cell
-                        if (not self.running
-                                and (r, c) != self.grid.start
-                                and (r, c) != self.grid.target):
-                            self.grid.grid[r][c] = WALL
-
-            # ── auto-step ───────────────────────────────────
-            if self.running and not self.step_mode:
-                now = time.time()
-                if now - self.last_t >= 1.0 / self.speed:
-                    self.step()
-                    self.last_t = now
+                if event.type == pygame.MOUSEMOTION:
+                    # hover highlights may change; painting definitely does
+                    self.needs_redraw = True
+                    if dragging_wall:
+                        cell = self.pixel_to_cell(*event.pos)
+                        # skip redundant work while the pointer stays
+                        # inside the cell it just painted
+                        if cell and cell != last_paint:
+                            last_paint = cell
+                            r, c = cell
+                            if (not self.running
+                                    and (r, c) != self.grid.start
+                                    and (r, c) != self.grid.target):
+                                self.grid.grid[r][c] = WALL
+                                self.grid.walls.add((r, c))
+
+                if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+                    self.needs_redraw = True
 
             # ── draw ────────────────────────────────────────
-            self.draw()
+            if self.needs_redraw:
+                self.draw()
+                self.needs_redraw = False
 
 
 # ──────────────────────────────────────────────
@@ -541,6 +825,11 @@ if __name__ == "__main__":
     print("  R key                 → reset")
     print("  Space key             → next step (in Step Mode)")
     print("=" * 55)
+    if hasattr(pygame, "IS_CE"):
+        print(f"Running on pygame-ce {pygame.version.ver}")
+    else:
+        print(f"Running on legacy pygame {pygame.version.ver} "
+              "(consider: pip install pygame-ce)")
 
     app = PathfinderApp()
     app.run()
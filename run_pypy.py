@@ -0,0 +1,31 @@
+# ============================================================
+# AI PATHFINDER - PyPy launcher
+# GOOD PERFORMANCE TIME APP
+# ============================================================
+# HOW TO RUN:
+#   pypy -m pip install pygame-ce numpy
+#   pypy run_pypy.py
+#
+# Why PyPy: the main loop, event handling, and the search
+# generators are tuple-at-a-time Python with lots of small
+# set/dict/list operations — exactly the interpreter-bound code
+# PyPy's tracing JIT speeds up (typically several times faster).
+# pygame-ce supports PyPy; numba is skipped automatically when
+# unavailable, which is fine — the JIT covers the same loops.
+#
+# The same script also runs fine under CPython; it just prints a
+# hint when a faster interpreter is available.
+# ============================================================
+
+import sys
+
+if sys.implementation.name != "pypy":
+    print(f"Note: running on {sys.implementation.name} – "
+          "for best performance use PyPy:")
+    print("  pypy -m pip install pygame-ce numpy")
+    print("  pypy run_pypy.py")
+
+from pathfinder import PathfinderApp
+
+if __name__ == "__main__":
+    PathfinderApp().run()